@@ -0,0 +1,99 @@
+"""Backpressure for Streamlit reruns.
+
+``TokenBucket`` limits how fast a single session can submit answers or
+click buttons that trigger a rerun. ``AdmissionController`` caps how many
+reruns the whole process renders at once: essential reruns (crisis help,
+an answer containing crisis words) are always let through, everything
+else waits for a free slot and is turned away if none frees up in time.
+"""
+import threading
+import time
+from contextlib import contextmanager
+
+
+class TokenBucket:
+    """Allow ``capacity`` actions in a burst, refilled at ``rate`` per second"""
+
+    def __init__(self, rate, capacity):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def try_acquire(self):
+        """Spend one token if available; never blocks"""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return True
+            return False
+
+
+class AdmissionController:
+    """Process-wide cap on concurrent reruns, with counters for monitoring"""
+
+    def __init__(self, max_concurrent, queue_timeout):
+        self.max_concurrent = max_concurrent
+        self.queue_timeout = queue_timeout
+        self._slots = threading.BoundedSemaphore(max_concurrent)
+        self._lock = threading.Lock()
+        self._counts = {
+            'admitted': 0,
+            'admitted_essential': 0,
+            'queued': 0,
+            'rejected': 0,
+            'rate_limited': 0,
+            'in_flight': 0,
+            'peak_in_flight': 0,
+        }
+
+    def _add(self, name, amount=1):
+        with self._lock:
+            self._counts[name] += amount
+            if name == 'in_flight':
+                self._counts['peak_in_flight'] = max(
+                    self._counts['peak_in_flight'], self._counts['in_flight']
+                )
+
+    @contextmanager
+    def admit(self, essential=False):
+        """Yield True if the rerun may render, False if it was turned away"""
+        if essential:
+            # Essential reruns skip the queue but still take a slot when one is
+            # free, so they push other traffic into the queue under load
+            holding = self._slots.acquire(blocking=False)
+            self._add('admitted_essential')
+        else:
+            holding = self._slots.acquire(blocking=False)
+            if not holding:
+                self._add('queued')
+                holding = self._slots.acquire(timeout=self.queue_timeout)
+            if not holding:
+                self._add('rejected')
+                yield False
+                return
+            self._add('admitted')
+
+        self._add('in_flight')
+        try:
+            yield True
+        finally:
+            self._add('in_flight', -1)
+            if holding:
+                self._slots.release()
+
+    def record_rate_limited(self):
+        """Count a submission that a session's TokenBucket refused"""
+        self._add('rate_limited')
+
+    def snapshot(self):
+        """Return current limits and counters as a plain dict"""
+        with self._lock:
+            metrics = dict(self._counts)
+        metrics['max_concurrent'] = self.max_concurrent
+        metrics['queue_timeout'] = self.queue_timeout
+        return metrics
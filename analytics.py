@@ -0,0 +1,194 @@
+"""Anonymous outcome analytics for the Therapy Guide.
+
+``EventBuffer.record`` appends an event to a bounded in-memory buffer and
+returns at once; a background thread writes buffered events to a rotating
+JSON-lines log in batches. When the buffer is full new events are dropped
+(and counted) rather than slowing a rerun down. Events never contain
+answer text, only a random per-assessment id, question numbers, the
+recommended therapy and the recommended resources.
+
+Summarize a log offline with:
+
+    python analytics.py logs/analytics.jsonl
+"""
+import argparse
+import glob
+import json
+import os
+import sys
+import threading
+import time
+from collections import Counter, defaultdict
+
+
+class EventBuffer:
+    """Non-blocking event buffer flushed to a rotating log by a background thread"""
+
+    def __init__(self, path, max_events=5000, batch_size=500, flush_interval=2.0,
+                 max_bytes=5 * 1024 * 1024, backup_count=5):
+        self.path = path
+        self.max_events = max_events
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+        self.dropped = 0
+        self.written = 0
+
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._events = []
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._closed = False
+        self._thread = threading.Thread(target=self._flush_loop, name="analytics-flusher", daemon=True)
+        self._thread.start()
+
+    def record(self, event, **fields):
+        """Buffer one event; drops it if the buffer is full"""
+        fields['event'] = event
+        fields['ts'] = round(time.time(), 3)
+        with self._lock:
+            if self._closed or len(self._events) >= self.max_events:
+                self.dropped += 1
+                return False
+            self._events.append(fields)
+            full_batch = len(self._events) >= self.batch_size
+        if full_batch:
+            self._wake.set()
+        return True
+
+    def flush(self):
+        """Write everything buffered so far; called by the flusher thread and close()"""
+        with self._lock:
+            events, self._events = self._events, []
+        if not events:
+            return
+        data = ''.join(json.dumps(event, separators=(',', ':')) + '\n' for event in events)
+        self._rotate_if_needed(len(data))
+        with open(self.path, 'a', encoding='utf-8') as f:
+            f.write(data)
+        self.written += len(events)
+
+    def close(self):
+        """Stop the flusher after writing any buffered events"""
+        with self._lock:
+            self._closed = True
+        self._wake.set()
+        self._thread.join()
+
+    def _flush_loop(self):
+        while not self._closed:
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            try:
+                self.flush()
+            except OSError:
+                # Analytics must never take the app down; lose this batch instead
+                pass
+        self.flush()
+
+    def _rotate_if_needed(self, incoming):
+        try:
+            size = os.path.getsize(self.path)
+        except OSError:
+            return
+        if size + incoming <= self.max_bytes:
+            return
+        for index in range(self.backup_count - 1, 0, -1):
+            source = f"{self.path}.{index}"
+            if os.path.exists(source):
+                os.replace(source, f"{self.path}.{index + 1}")
+        os.replace(self.path, f"{self.path}.1")
+
+
+def read_events(paths):
+    """Yield events from log files, oldest rotated backup first
+
+    Only numbered backups (``path.1`` ... ``path.N``) are read. Lines that
+    are not valid JSON, such as a last line cut off mid-write, are skipped.
+    """
+    for path in paths:
+        backups = []
+        for filename in glob.glob(f"{glob.escape(path)}.*"):
+            suffix = filename[len(path) + 1:]
+            if suffix.isdigit():
+                backups.append((int(suffix), filename))
+        files = [filename for _, filename in sorted(backups, reverse=True)] + [path]
+        for filename in files:
+            if not os.path.exists(filename):
+                continue
+            with open(filename, encoding='utf-8') as f:
+                for line in f:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        yield json.loads(line)
+                    except ValueError:
+                        continue
+
+
+def summarize(events):
+    """Aggregate events into counts for therapies, resources, crises and drop-off"""
+    assessments = defaultdict(lambda: {'answered': -1, 'crisis': False, 'completed': False})
+    therapies = Counter()
+    resource_sets = Counter()
+
+    for event in events:
+        assessment = assessments[event.get('assessment')]
+        kind = event['event']
+        if kind == 'answer_submitted':
+            assessment['answered'] = max(assessment['answered'], event['question'])
+        elif kind == 'crisis_triggered':
+            assessment['crisis'] = True
+        elif kind == 'assessment_completed':
+            assessment['completed'] = True
+            therapies[event['best_therapy']] += 1
+            resource_sets[', '.join(event['resources'])] += 1
+
+    drop_off = Counter()
+    for assessment in assessments.values():
+        if not assessment['completed']:
+            # The question they were looking at when they left (1-based)
+            drop_off[assessment['answered'] + 2] += 1
+
+    total = len(assessments)
+    crises = sum(1 for a in assessments.values() if a['crisis'])
+    return {
+        'assessments': total,
+        'completed': sum(1 for a in assessments.values() if a['completed']),
+        'crisis_triggered': crises,
+        'crisis_rate': round(crises / total, 4) if total else 0.0,
+        'recommended_therapy': dict(therapies.most_common()),
+        'resource_sets': dict(resource_sets.most_common()),
+        'drop_off_question': dict(sorted(drop_off.items())),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Summarize Therapy Guide analytics logs")
+    parser.add_argument('paths', nargs='+', help="analytics log file(s); rotated backups are included")
+    parser.add_argument('--json', action='store_true', help="print the summary as JSON")
+    args = parser.parse_args(argv)
+
+    summary = summarize(read_events(args.paths))
+    if args.json:
+        print(json.dumps(summary, indent=2))
+        return 0
+
+    print(f"Assessments: {summary['assessments']} ({summary['completed']} completed)")
+    print(f"Crisis triggered: {summary['crisis_triggered']} ({summary['crisis_rate']:.1%})")
+    print("Recommended therapy:")
+    for therapy, count in summary['recommended_therapy'].items():
+        print(f"  {therapy}: {count}")
+    print("Resource sets:")
+    for resources, count in summary['resource_sets'].items():
+        print(f"  {count:>5}  {resources}")
+    print("Drop-off by question:")
+    for question, count in summary['drop_off_question'].items():
+        print(f"  Q{question}: {count}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
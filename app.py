@@ -1,7 +1,16 @@
 import streamlit as st
 from datetime import datetime
+import atexit
+import bisect
+import importlib
+import os
 import re
+import unicodedata
+import uuid
+from collections import namedtuple
 from streamlit_option_menu import option_menu
+from admission import AdmissionController, TokenBucket
+from keyword_index import build_keyword_index
 
 # Page configuration
 st.set_page_config(
@@ -223,9 +232,212 @@ st.markdown("""
     </style>
 """, unsafe_allow_html=True)
 
+# 🌐 LOCALES - English lives in TherapyBotGuide, other packs load from locales/
+DEFAULT_LOCALE = 'en'
+SUPPORTED_LOCALES = ('en', 'fr')
+
+# Words common in one language and rare in the others. Tokens that are also
+# English words or fragments ("me", "plus", "de", "en", "ai"...) are left
+# out, so an English answer is never taken for French
+LOCALE_HINTS = {
+    'en': frozenset([
+        'i', 'im', "i'm", "i've", "i'd", "i'll", 'my', 'the', 'and', 'is',
+        'am', 'have', 'been', 'with', 'for', 'not', 'feel', 'feeling', 'it',
+        "it's", 'to', 'of', 'that', 'this', 'was', 'about', 'months',
+        'years', 'weeks', 'yes', 'no', 'online', "don't", "can't"
+    ]),
+    'fr': frozenset([
+        'je', "j'ai", "j'en", 'suis', 'mes', 'et', 'les', 'pas', 'que',
+        'qui', 'avec', 'pour', 'dans', 'est', "c'est", "n'ai", "n'est",
+        'une', 'du', 'vous', 'tres', 'depuis', 'mais', 'mois', 'ans',
+        'semaines', 'oui', 'ligne', 'veux', 'moi', 'rien', 'trop', 'aucune',
+        'envie', 'peux', 'avoir', 'etre', 'tout', 'beaucoup'
+    ])
+}
+
+# Accented letters count as a hint too, so "anxiété" alone is recognized
+LOCALE_ACCENTS = {
+    'fr': frozenset('àâçéèêëîïôûùüÿœæ')
+}
+
+# A non-default pack is used only when its hints reach this count and are
+# more than twice the default language's hints
+MIN_LOCALE_HINTS = 2
+
+WORD_PATTERN = re.compile(r"[a-z]+(?:['-][a-z]+)*")
+
+# Crisis phrases are few and always checked in every language, so they live
+# here rather than in the lazily loaded keyword packs
+LOCALE_CRISIS_WORDS = {
+    'fr': [
+        'suicide', 'me suicider', 'me tuer', 'mettre fin à mes jours',
+        'mettre fin à ma vie', 'envie de mourir', 'veux mourir',
+        'me faire du mal', 'me blesser', 'surdose', 'overdose',
+        'en finir', 'plus la force de continuer', 'mieux mort', 'mieux morte',
+        'aucune raison de vivre', 'plus envie de vivre'
+    ]
+}
+
+
+def fold_text(text):
+    """Lowercase text and strip accents so 'anxiété' and 'anxiete' match"""
+    text = text.lower()
+    if text.isascii():
+        return text
+    decomposed = unicodedata.normalize('NFKD', text)
+    return ''.join(char for char in decomposed if not unicodedata.combining(char))
+
+
+def detect_locale(text):
+    """Pick the keyword pack for a single answer from common words and accents
+
+    Falls back to DEFAULT_LOCALE unless another language clearly outweighs
+    it, so a bare list of keywords like "rupture, stress" or a number like
+    "7" is scored with the default pack.
+    """
+    text_lower = text.lower()
+    if not text_lower.isascii():
+        text_lower = text_lower.replace('’', "'")
+    # Hyphenated words stay whole, so "de-motivated" is not read as "de"
+    words = set(WORD_PATTERN.findall(fold_text(text_lower)))
+    if not words:
+        return DEFAULT_LOCALE
+    default_hits = len(LOCALE_HINTS[DEFAULT_LOCALE] & words)
+    best_locale, best_hits = DEFAULT_LOCALE, 0
+    for locale in SUPPORTED_LOCALES:
+        if locale == DEFAULT_LOCALE:
+            continue
+        hits = len(LOCALE_HINTS[locale] & words)
+        accents = LOCALE_ACCENTS.get(locale)
+        if accents and not text_lower.isascii():
+            hits += sum(1 for char in text_lower if char in accents)
+        if hits >= MIN_LOCALE_HINTS and hits > 2 * default_hits and hits > best_hits:
+            best_locale, best_hits = locale, hits
+    return best_locale
+
+
+def load_locale_pack(locale):
+    """Import the keyword lists for a non-default locale from locales/"""
+    if locale not in SUPPORTED_LOCALES or locale == DEFAULT_LOCALE:
+        raise ValueError(f"No keyword pack for locale '{locale}'")
+    return importlib.import_module(f"locales.{locale}").GOOD_FOR
+
+
+def build_crisis_pattern(crisis_words):
+    """Compile crisis phrases into one accent-insensitive alternation"""
+    return re.compile('|'.join(re.escape(fold_text(word)) for word in crisis_words))
+
+
+# One keyword match: which answer, where in it (after lowercasing and accent
+# folding), the keyword as written in the lists, the therapy it counted for
+# and the points it earned
+MatchSpan = namedtuple('MatchSpan', ['answer', 'offset', 'keyword', 'therapy', 'points'])
+
+
+class KeywordMatcher:
+    """Therapy keyword lists for one locale, pre-processed for matching"""
+
+    def __init__(self, good_for):
+        # One entry per unique keyword, so keywords shared by therapies are checked once
+        self.keyword_index = build_keyword_index(good_for, normalize=fold_text)
+
+    def add_scores(self, answers, therapy_scores, spans=None, answer_indexes=None):
+        """Add 2 points per keyword found in the answers, or 1 if only one of its words is
+
+        If spans is a list, a MatchSpan is appended for every match found
+        during the same scan; answer_indexes maps answers to their position
+        in the whole conversation.
+        """
+        folded = [fold_text(answer) for answer in answers]
+        user_text = ' '.join(folded)
+        if spans is None:
+            user_words = set(user_text.split())
+        else:
+            # Remember where each word first appears so partial matches get an offset
+            user_words = {}
+            for match in re.finditer(r'\S+', user_text):
+                user_words.setdefault(match.group(), match.start())
+            starts = []
+            position = 0
+            for answer in folded:
+                starts.append(position)
+                position += len(answer) + 1
+            if answer_indexes is None:
+                answer_indexes = range(len(answers))
+
+        for keyword_lower, words, weights, label in self.keyword_index:
+            offset = user_text.find(keyword_lower)
+            if offset >= 0:
+                points = 2
+            else:
+                points = 0
+                for word in words:
+                    if word in user_words:
+                        points = 1
+                        break
+                if not points:
+                    continue
+            if spans is not None:
+                if points == 1:
+                    offset = user_words[word]
+                answer = bisect.bisect_right(starts, offset) - 1
+            for therapy_name, weight in weights:
+                if therapy_name not in therapy_scores:
+                    continue
+                therapy_scores[therapy_name] += points * weight
+                if spans is not None:
+                    spans.append(MatchSpan(answer_indexes[answer], offset - starts[answer],
+                                           label, therapy_name, points * weight))
+
+
+# Longer than any crisis phrase in any pack, so a phrase split across answers is caught
+CRISIS_CARRY_CHARS = 64
+
+
+class CrisisScanner:
+    """Per-session crisis check that carries the end of earlier answers forward"""
+
+    def __init__(self, answers=()):
+        self.tail = ''
+        for answer in answers:
+            self.accept(answer)
+
+    def check(self, bot, user_message):
+        """Scan only the new answer plus the carried tail of the previous ones"""
+        return bot.check_for_crisis(user_message, self.tail)
+
+    def accept(self, user_message):
+        """Remember the end of an answer once it has been added to the conversation"""
+        tail = f"{self.tail} {fold_text(user_message[-CRISIS_CARRY_CHARS:])}"
+        self.tail = tail[-CRISIS_CARRY_CHARS:]
+
+
+@st.cache_resource(show_spinner=False)
+def load_keyword_matcher(locale):
+    """Build the matcher for a locale once per server, shared by every session"""
+    if locale == DEFAULT_LOCALE:
+        bot = TherapyBotGuide()
+        good_for = {name: info['good_for'] for name, info in bot.therapy_types.items()}
+    else:
+        good_for = load_locale_pack(locale)
+    return KeywordMatcher(good_for)
+
+
+@st.cache_resource(show_spinner=False)
+def load_crisis_pattern():
+    """Compile every locale's crisis phrases into one pattern, once per server"""
+    crisis_words = list(TherapyBotGuide().crisis_words)
+    for words in LOCALE_CRISIS_WORDS.values():
+        crisis_words.extend(words)
+    return build_crisis_pattern(crisis_words)
+
+
 class TherapyBotGuide:
+
     def __init__(self):
         """Initialize the bot with all its knowledge and capabilities"""
+        self._matchers = {}
+        self._crisis_pattern = None
         self.crisis_words = [
             'suicide', 'kill myself', 'end my life', 'want to die',
             'hurt myself', 'overdose', 'can\'t go on', 'ending it all',
@@ -402,15 +614,27 @@ class TherapyBotGuide:
             }
         }
 
-    def check_for_crisis(self, user_message):
-        """Check if someone is in immediate danger"""
+    def get_matcher(self, locale=DEFAULT_LOCALE):
+        """Return the compiled matcher for a locale, building it on first use"""
+        # Kept on the instance too, so repeat lookups skip the st.cache_resource overhead
+        matcher = self._matchers.get(locale)
+        if matcher is None:
+            matcher = self._matchers[locale] = load_keyword_matcher(locale)
+        return matcher
+
+    def check_for_crisis(self, user_message, previous_text=''):
+        """Check if someone is in immediate danger
+
+        previous_text is the end of earlier answers, so a phrase that starts
+        there and finishes in user_message is still caught.
+        """
         if not user_message:
             return False
-        message_lower = user_message.lower()
-        for crisis_word in self.crisis_words:
-            if crisis_word in message_lower:
-                return True
-        return False
+        text = f"{previous_text} {user_message}" if previous_text else user_message
+        # Every locale's crisis phrases are checked, whatever language the answer seems to be in
+        if self._crisis_pattern is None:
+            self._crisis_pattern = load_crisis_pattern()
+        return self._crisis_pattern.search(fold_text(text)) is not None
 
     def get_crisis_help(self):
         """Provide immediate crisis resources"""
@@ -434,32 +658,33 @@ class TherapyBotGuide:
         **You are NOT alone. These feelings CAN change with help.**
         """
 
-    def find_best_therapy(self, user_problems):
-        """Find the best therapy type based on user's problems"""
+    def find_best_therapy(self, user_problems, explain=False):
+        """Find the best therapy type based on user's problems
+
+        With explain=True a third value is returned: the MatchSpans behind
+        the scores, collected in the same scan.
+        """
         therapy_scores = {}
         for therapy_name in self.therapy_types:
             therapy_scores[therapy_name] = 0
+        spans = [] if explain else None
+
+        # Answers clearly written in another language use that language's pack, the rest the default pack
+        answers_by_locale = {}
+        for index, answer in enumerate(user_problems):
+            answers_by_locale.setdefault(detect_locale(answer), []).append(index)
 
-        user_text = ' '.join(user_problems).lower()
-        user_words = set(user_text.split())
-
-        for therapy_name, therapy_info in self.therapy_types.items():
-            for keyword in therapy_info['good_for']:
-                keyword_lower = keyword.lower()
-                if keyword_lower in user_text:
-                    therapy_scores[therapy_name] += 2
-                else:
-                    keyword_words = keyword_lower.split()
-                    for word in keyword_words:
-                        if len(word) > 2 and word in user_words:
-                            therapy_scores[therapy_name] += 1
-                            break
+        for locale, indexes in answers_by_locale.items():
+            answers = [user_problems[index] for index in indexes]
+            self.get_matcher(locale).add_scores(answers, therapy_scores, spans, indexes)
 
         if max(therapy_scores.values()) > 0:
             best_therapy = max(therapy_scores, key=therapy_scores.get)
         else:
             best_therapy = 'CBT'
 
+        if explain:
+            return best_therapy, therapy_scores, spans
         return best_therapy, therapy_scores
 
     def get_resources_for_user(self, user_preferences):
@@ -497,6 +722,141 @@ class TherapyBotGuide:
 
         return final_resources
 
+# 💾 PROGRESS STORE - optional, enabled by pointing this at a local SQLite file
+PROGRESS_DB_PATH = os.environ.get('THERAPY_GUIDE_PROGRESS_DB')
+
+
+@st.cache_resource(show_spinner=False)
+def get_progress_store():
+    """Open the progress store once per server, or None when persistence is off"""
+    if not PROGRESS_DB_PATH:
+        return None
+    # Imported here so sqlite3 is only loaded when persistence is switched on
+    from progress_store import ProgressStore
+    store = ProgressStore(PROGRESS_DB_PATH)
+    # The writer is a daemon thread, so commit queued writes before the process exits
+    atexit.register(store.close)
+    return store
+
+
+def restore_progress():
+    """Resume an in-flight assessment from the session token in the URL"""
+    store = get_progress_store()
+    if store is None or 'session_token' in st.session_state:
+        return
+    token = st.experimental_get_query_params().get('session', [None])[0]
+    progress = store.load(token) if token else None
+    if progress is None:
+        from progress_store import new_session_token
+        token = new_session_token()
+        st.experimental_set_query_params(session=token)
+    else:
+        st.session_state.current_question, st.session_state.user_answers, assessment_id = progress
+        st.session_state.assessment_started = True
+        # Keep analytics for a resumed assessment under its original id
+        if assessment_id:
+            st.session_state.assessment_id = assessment_id
+    st.session_state.session_token = token
+
+
+def save_progress():
+    """Queue the current answers for the background writer"""
+    store = get_progress_store()
+    if store is not None and 'session_token' in st.session_state:
+        store.save(st.session_state.session_token,
+                   st.session_state.current_question,
+                   st.session_state.user_answers,
+                   st.session_state.get('assessment_id'))
+
+
+def clear_progress():
+    """Forget stored answers so a restart doesn't resume them"""
+    store = get_progress_store()
+    if store is not None and 'session_token' in st.session_state:
+        store.delete(st.session_state.session_token)
+
+
+# 📊 ANALYTICS - optional, anonymous outcome events written in the background
+ANALYTICS_LOG_PATH = os.environ.get('THERAPY_GUIDE_ANALYTICS_LOG')
+
+
+@st.cache_resource(show_spinner=False)
+def get_analytics():
+    """Start the analytics buffer once per server, or None when analytics is off"""
+    if not ANALYTICS_LOG_PATH:
+        return None
+    from analytics import EventBuffer
+    buffer = EventBuffer(ANALYTICS_LOG_PATH)
+    # Write buffered events before the process exits
+    atexit.register(buffer.close)
+    return buffer
+
+
+def record_event(event, **fields):
+    """Buffer an analytics event tagged with a random per-assessment id"""
+    buffer = get_analytics()
+    if buffer is None:
+        return
+    if 'assessment_id' not in st.session_state:
+        st.session_state.assessment_id = uuid.uuid4().hex
+    buffer.record(event, assessment=st.session_state.assessment_id, **fields)
+
+
+# 🚦 BACKPRESSURE - per-session rate limit and a process-wide cap on reruns
+SUBMISSION_RATE = float(os.environ.get('THERAPY_GUIDE_SUBMISSIONS_PER_SECOND', '1'))
+SUBMISSION_BURST = int(os.environ.get('THERAPY_GUIDE_SUBMISSION_BURST', '5'))
+MAX_CONCURRENT_RERUNS = int(os.environ.get('THERAPY_GUIDE_MAX_CONCURRENT_RERUNS', '8'))
+RERUN_QUEUE_TIMEOUT = float(os.environ.get('THERAPY_GUIDE_RERUN_QUEUE_TIMEOUT', '5'))
+SHOW_METRICS = os.environ.get('THERAPY_GUIDE_SHOW_METRICS') == '1'
+
+
+@st.cache_resource(show_spinner=False)
+def get_admission_controller():
+    """Create the admission controller once per server, shared by every session"""
+    return AdmissionController(MAX_CONCURRENT_RERUNS, RERUN_QUEUE_TIMEOUT)
+
+
+def allow_submission():
+    """Spend a token from this session's bucket, warning the user when it's empty"""
+    if st.session_state.rate_limiter.try_acquire():
+        return True
+    get_admission_controller().record_rate_limited()
+    st.warning("⏳ That was a little fast - please wait a moment and try again.")
+    return False
+
+
+def show_pending_answer(answer):
+    """Show an answer that was held back, with a button to send it; True if clicked"""
+    with st.chat_message("user"):
+        st.write(answer)
+    st.caption("⏳ This answer hasn't been sent yet.")
+    return st.button("📨 Send this answer", key="send_pending_answer")
+
+
+def show_busy_message():
+    """Shown instead of a page when the server is too busy to render it"""
+    st.warning("⏳ The Therapy Guide is very busy right now. Please try again in a moment.")
+    st.write("**Need help now?** Use **⚠️ Crisis Help** in the sidebar, call/text **988** (US) or **9-8-8** (Canada), or call **911** in an emergency.")
+
+
+# 🔥 WARM-UP - only serve.py calls this, at boot; plain `streamlit run` builds things on first use
+WARM_UP_LOCALES = [
+    locale.strip() for locale in os.environ.get('THERAPY_GUIDE_WARM_LOCALES', DEFAULT_LOCALE).split(',')
+    if locale.strip() in SUPPORTED_LOCALES
+]
+
+
+def warm_up():
+    """Build the knowledge base, the crisis pattern, matchers for WARM_UP_LOCALES and shared services"""
+    # Every locale's crisis phrases are checked on the first answer, whatever WARM_UP_LOCALES says
+    load_crisis_pattern()
+    for locale in WARM_UP_LOCALES:
+        load_keyword_matcher(locale)
+    get_admission_controller()
+    get_progress_store()
+    get_analytics()
+
+
 def main():
     """Main Streamlit application"""
     if 'bot' not in st.session_state:
@@ -517,6 +877,11 @@ def main():
         st.session_state.assessment_started = False
     if 'show_results' not in st.session_state:
         st.session_state.show_results = False
+    if 'rate_limiter' not in st.session_state:
+        st.session_state.rate_limiter = TokenBucket(SUBMISSION_RATE, SUBMISSION_BURST)
+    restore_progress()
+    if 'crisis_scanner' not in st.session_state:
+        st.session_state.crisis_scanner = CrisisScanner(st.session_state.user_answers)
 
     st.title("🌱 Therapy Guide")
     st.markdown("**Your Personal Mental Health Resource Finder**")
@@ -530,10 +895,16 @@ def main():
     
     with st.sidebar.expander("⚙️ Troubleshooting"):
         st.write("Having issues? Try clearing the session:")
-        if st.button("🗑️ Clear Session & Restart"):
+        if st.button("🗑️ Clear Session & Restart") and allow_submission():
+            clear_progress()
+            # Keep the rate limiter so clearing the session doesn't reset it
             for key in list(st.session_state.keys()):
-                del st.session_state[key]
+                if key != 'rate_limiter':
+                    del st.session_state[key]
             st.rerun()
+        if SHOW_METRICS:
+            st.write("**Server load:**")
+            st.json(get_admission_controller().snapshot())
 
     if not st.session_state.assessment_started:
         with st.sidebar:
@@ -558,28 +929,41 @@ def main():
                     }
                 }
             )
-        
-        if selected == "Home":
-            show_home_page()
-        elif selected == "Crisis Resources":
-            show_crisis_page()
-        elif selected == "Learn About Therapy":
-            show_therapy_types_page()
-        elif selected == "Find Resources":
-            show_resources_page()
+
+        # The crisis page never waits; the other pages queue for a free slot
+        with get_admission_controller().admit(essential=selected == "Crisis Resources") as admitted:
+            if not admitted:
+                show_busy_message()
+            elif selected == "Home":
+                show_home_page()
+            elif selected == "Crisis Resources":
+                show_crisis_page()
+            elif selected == "Learn About Therapy":
+                show_therapy_types_page()
+            elif selected == "Find Resources":
+                show_resources_page()
     else:
         st.sidebar.write("✍️ **Assessment in Progress**")
-        if st.sidebar.button("↻ Start Over"):
+        if st.sidebar.button("↻ Start Over") and allow_submission():
+            clear_progress()
             st.session_state.assessment_started = False
             st.session_state.current_question = 0
             st.session_state.user_answers = []
             st.session_state.show_results = False
             st.rerun()
 
-        if st.session_state.show_results:
-            show_assessment_results()
-        else:
-            show_assessment_page()
+        # The crisis check runs before admission; only an answer with crisis words skips the queue
+        user_input, crisis = read_assessment_answer()
+        with get_admission_controller().admit(essential=crisis) as admitted:
+            if not admitted:
+                if user_input:
+                    # Kept like a rate-limited answer, so it isn't lost while the server is busy
+                    st.session_state.pending_answer = (st.session_state.current_question, user_input)
+                show_busy_message()
+            elif st.session_state.show_results:
+                show_assessment_results()
+            else:
+                show_assessment_page(user_input, crisis)
 
 def show_home_page():
     """Show the home page"""
@@ -600,6 +984,10 @@ def show_home_page():
             st.session_state.current_question = 0
             st.session_state.user_answers = []
             st.session_state.show_results = False
+            st.session_state.assessment_id = uuid.uuid4().hex
+            st.session_state.outcome_recorded = False
+            st.session_state.crisis_scanner = CrisisScanner()
+            record_event('assessment_started')
             st.rerun()
 
     with col2:
@@ -628,8 +1016,27 @@ def show_home_page():
     with col3:
         st.metric("Crisis Support", "24/7", "Available worldwide")
 
-def show_assessment_page():
-    """Show the assessment questionnaire"""
+def read_assessment_answer():
+    """Render the answer box and check a new answer for crisis words; returns (answer, crisis)"""
+    bot = st.session_state.bot
+    question = st.session_state.current_question
+    if st.session_state.show_results or question >= len(bot.assessment_questions):
+        return None, False
+    user_input = st.chat_input("Your answer...", key=f"q_{question}")
+    if not user_input:
+        return None, False
+    if st.session_state.crisis_scanner.check(bot, user_input):
+        record_event('crisis_triggered', question=question)
+        return user_input, True
+    return user_input, False
+
+
+def show_assessment_page(user_input=None, crisis=False):
+    """Show the assessment questionnaire
+
+    user_input and crisis come from read_assessment_answer, which runs
+    before the page is admitted.
+    """
     st.header("✍️ Mental Health Assessment")
     st.write("Please answer these questions honestly. Your responses will help me recommend appropriate resources.")
 
@@ -651,19 +1058,38 @@ def show_assessment_page():
         with st.chat_message("assistant"):
             st.write(current_question)
         
-        user_input = st.chat_input("Your answer...", key=f"q_{st.session_state.current_question}")
-        
+        if crisis:
+            st.error(st.session_state.bot.get_crisis_help())
+            return
+
+        # An answer held back by the rate limit or a busy server, kept so the
+        # user doesn't have to retype it; it passed the crisis check already
+        pending = st.session_state.get('pending_answer')
+        if pending and pending[0] != st.session_state.current_question:
+            pending = st.session_state.pending_answer = None
+        pending_shown = False
+        if not user_input and pending:
+            pending_shown = True
+            if show_pending_answer(pending[1]):
+                user_input = pending[1]
+
         if user_input:
-            if st.session_state.bot.check_for_crisis(user_input):
-                st.error(st.session_state.bot.get_crisis_help())
+            if not allow_submission():
+                st.session_state.pending_answer = (st.session_state.current_question, user_input)
+                if not pending_shown:
+                    show_pending_answer(user_input)
                 return
+            st.session_state.pending_answer = None
             
             if len(st.session_state.user_answers) <= st.session_state.current_question:
                 st.session_state.user_answers.append(user_input)
             else:
                 st.session_state.user_answers[st.session_state.current_question] = user_input
+            st.session_state.crisis_scanner.accept(user_input)
             
+            record_event('answer_submitted', question=st.session_state.current_question)
             st.session_state.current_question += 1
+            save_progress()
             st.rerun()
     else:
         st.session_state.show_results = True
@@ -687,11 +1113,13 @@ def show_assessment_results():
                 st.rerun()
             return
             
-        best_therapy, therapy_scores = st.session_state.bot.find_best_therapy(st.session_state.user_answers)
+        best_therapy, therapy_scores, match_spans = st.session_state.bot.find_best_therapy(
+            st.session_state.user_answers, explain=True
+        )
         therapy_info = st.session_state.bot.therapy_types[best_therapy]
     except Exception as e:
         st.error(f"⚠️ Error generating recommendations: {str(e)}")
-        if st.button("↻ Try Again"):
+        if st.button("↻ Try Again") and allow_submission():
             st.session_state.show_results = False
             st.rerun()
         return
@@ -707,16 +1135,29 @@ def show_assessment_results():
     with st.expander("📈 See how other therapies scored for you"):
         st.write("**Your therapy scores:** (sorted from highest to lowest)")
         sorted_scores = sorted(therapy_scores.items(), key=lambda x: x[1], reverse=True)
+        spans_by_therapy = {}
+        for span in match_spans:
+            spans_by_therapy.setdefault(span.therapy, []).append(span)
         for therapy_name, score in sorted_scores:
             therapy_data = st.session_state.bot.therapy_types[therapy_name]
             if score > 0:
                 st.write(f"✅ **{therapy_data['name']}:** {score} matches")
+                matched = [
+                    f"\"{span.keyword}\" (answer {span.answer + 1}, +{span.points})"
+                    for span in spans_by_therapy.get(therapy_name, [])
+                ]
+                st.caption("Matched: " + ", ".join(matched))
             else:
                 st.write(f"⭕ **{therapy_data['name']}:** {score} matches")
 
     st.subheader("🔗 Where to Find Help")
     resources = st.session_state.bot.get_resources_for_user(st.session_state.user_answers)
 
+    # Results rerun on every click, so only the first render is counted
+    if not st.session_state.get('outcome_recorded'):
+        record_event('assessment_completed', best_therapy=best_therapy, resources=resources)
+        st.session_state.outcome_recorded = True
+
     for resource_name in resources:
         resource = st.session_state.bot.professional_resources[resource_name]
         with st.container():
@@ -739,7 +1180,8 @@ def show_assessment_results():
     5. **Don't give up** - help is available!
     """)
 
-    if st.button("↻ Take Assessment Again"):
+    if st.button("↻ Take Assessment Again") and allow_submission():
+        clear_progress()
         st.session_state.assessment_started = False
         st.session_state.current_question = 0
         st.session_state.user_answers = []
@@ -828,4 +1270,9 @@ def show_resources_page():
                 st.markdown("---")
 
 if __name__ == "__main__":
-    main()
+    # serve.py sets warm_up_only for its boot-time run, so caches are filled
+    # under the same keys real sessions use without rendering any page
+    if st.session_state.get('warm_up_only'):
+        warm_up()
+    else:
+        main()
@@ -0,0 +1,58 @@
+"""Measure the per-submission cost of crisis scanning as a conversation grows.
+
+Compares checking only the latest answer (the old behaviour), the
+incremental CrisisScanner used by the app and rescanning the whole
+history on every submission. The incremental scanner should stay flat
+with conversation length and catch phrases split across answers.
+
+    python benchmarks/bench_crisis_scan.py [--repeat 2000]
+
+Needs the app's requirements installed, since it imports app.py.
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app import CrisisScanner, TherapyBotGuide  # noqa: E402
+
+ANSWER = "I've been feeling anxious and overwhelmed at work, and I can't sleep much lately"
+LENGTHS = (6, 25, 100, 400)
+
+
+def per_submission(check, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        check(ANSWER)
+    return (time.perf_counter() - start) / repeat * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--repeat', type=int, default=2000)
+    args = parser.parse_args()
+
+    bot = TherapyBotGuide()
+    # Compile the crisis pattern once up front; after that the bot keeps it on
+    # the instance, so the timings don't include the st.cache_resource lookup
+    bot.check_for_crisis(ANSWER)
+
+    print(f"{'answers so far':>14} {'latest only':>12} {'incremental':>12} {'full rescan':>12}  (us per submission)")
+    for length in LENGTHS:
+        history = [ANSWER] * length
+        scanner = CrisisScanner(history)
+        latest = per_submission(bot.check_for_crisis, args.repeat)
+        incremental = per_submission(lambda answer: scanner.check(bot, answer), args.repeat)
+        rescan = per_submission(lambda answer: bot.check_for_crisis(' '.join(history + [answer])), args.repeat)
+        print(f"{length:>14} {latest:>12.1f} {incremental:>12.1f} {rescan:>12.1f}")
+
+    scanner = CrisisScanner(["Honestly I feel like there's no point"])
+    split_caught = scanner.check(bot, "living anymore")
+    print(f"Phrase split across answers caught: {split_caught}")
+    return 0 if split_caught else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
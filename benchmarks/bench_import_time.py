@@ -0,0 +1,67 @@
+"""Check the import-time budget for the app's first paint.
+
+Runs the top-level imports of app.py in a fresh interpreter under
+``python -X importtime`` and reports the slowest modules. Exits non-zero
+if the total is over budget, or if a module that app.py is meant to load
+lazily was pulled in at import time.
+
+    python benchmarks/bench_import_time.py [--budget-ms 1500]
+"""
+import argparse
+import ast
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Only needed once a feature is used, never for first paint
+DEFERRED_MODULES = ('progress_store', 'sqlite3', 'locales.fr')
+
+
+def top_level_imports(path):
+    with open(path, encoding='utf-8') as f:
+        tree = ast.parse(f.read())
+    return [ast.unparse(node) for node in tree.body
+            if isinstance(node, (ast.Import, ast.ImportFrom))]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--budget-ms', type=float, default=1500.0)
+    parser.add_argument('--top', type=int, default=10)
+    args = parser.parse_args()
+
+    imports = top_level_imports(os.path.join(ROOT, 'app.py'))
+    code = '\n'.join(imports + [
+        'import sys',
+        f'print(",".join(m for m in {DEFERRED_MODULES!r} if m in sys.modules))',
+    ])
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', code],
+                            cwd=ROOT, capture_output=True, text=True)
+    if result.returncode != 0:
+        print(result.stderr.strip().splitlines()[-1])
+        return 2
+
+    # Lines look like "import time:   self [us] | cumulative | imported package"
+    rows = []
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        if not name.startswith(' ' * 2):
+            rows.append((int(cumulative), name.strip()))
+    total_ms = sum(cumulative for cumulative, _ in rows) / 1000
+
+    print(f"First-paint imports ({len(imports)} statements): {total_ms:.1f} ms (budget {args.budget_ms:.0f} ms)")
+    for cumulative, name in sorted(rows, reverse=True)[:args.top]:
+        print(f"  {cumulative / 1000:8.1f} ms  {name}")
+
+    eager = [m for m in result.stdout.strip().split(',') if m]
+    if eager:
+        print(f"Loaded at import time but should be deferred: {', '.join(eager)}")
+    return 0 if total_ms <= args.budget_ms and not eager else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,73 @@
+"""Measure what match-span collection costs in find_best_therapy.
+
+Times a full six-answer scoring run with explanations off and on, and
+uses tracemalloc to count the memory allocated per call in each mode.
+With explanations off the scorer should allocate nothing for spans.
+
+    python benchmarks/bench_match_spans.py [--repeat 2000]
+
+Needs the app's requirements installed, since it imports app.py.
+"""
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app import SUPPORTED_LOCALES, TherapyBotGuide  # noqa: E402
+
+ANSWERS = [
+    "I've been anxious and stressed since my breakup, lots of negative thoughts and arguing with my partner",
+    "About six months, maybe longer",
+    "7",
+    "I tried therapy once, it helped me understand my patterns",
+    "Online would be easier",
+    "I need something low-cost"
+]
+
+
+def timed(call, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        call()
+    return (time.perf_counter() - start) / repeat * 1e6
+
+
+def allocated(call, repeat):
+    call()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.take_snapshot()
+        results = [call() for _ in range(repeat)]
+        after = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+    del results
+    stats = after.compare_to(before, 'filename')
+    return sum(stat.size_diff for stat in stats) / repeat
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--repeat', type=int, default=2000)
+    args = parser.parse_args()
+
+    bot = TherapyBotGuide()
+    # Fetch every matcher once so the timings don't include the st.cache_resource lookup
+    for locale in SUPPORTED_LOCALES:
+        bot.get_matcher(locale)
+    plain = lambda: bot.find_best_therapy(ANSWERS)  # noqa: E731
+    explained = lambda: bot.find_best_therapy(ANSWERS, explain=True)  # noqa: E731
+    spans = explained()[2]
+
+    print(f"{'':<18} {'us/call':>9} {'bytes kept/call':>16}")
+    for name, call in (("explain=False", plain), ("explain=True", explained)):
+        print(f"{name:<18} {timed(call, args.repeat):>9.1f} {allocated(call, 200):>16.0f}")
+    print(f"{len(spans)} spans per call with explanations on")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
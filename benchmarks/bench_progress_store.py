@@ -0,0 +1,88 @@
+"""Measure what persistence adds to an assessment rerun.
+
+Each simulated rerun records one more answer, the same work
+show_assessment_page does before st.rerun(). We compare no persistence,
+the write-behind ProgressStore and a synchronous SQLite commit per rerun.
+
+    python benchmarks/bench_progress_store.py [--sessions 200] [--budget-us 100]
+
+Exits non-zero if the write-behind store's median overhead per rerun is
+above the budget.
+"""
+import argparse
+import os
+import sqlite3
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from progress_store import SCHEMA, ProgressStore, new_session_token  # noqa: E402
+
+ANSWERS = [
+    "I've been feeling anxious and overwhelmed since my breakup",
+    "About six months",
+    "7",
+    "I tried CBT once, the homework helped",
+    "Online would be easier",
+    "I need something low-cost, I live in Quebec"
+]
+
+
+def run_reruns(sessions, persist):
+    timings = []
+    for _ in range(sessions):
+        token = new_session_token()
+        user_answers = []
+        for current_question, answer in enumerate(ANSWERS):
+            start = time.perf_counter()
+            user_answers.append(answer)
+            persist(token, current_question + 1, user_answers)
+            timings.append(time.perf_counter() - start)
+    return timings
+
+
+def summarize(name, timings):
+    timings = sorted(timings)
+    median = statistics.median(timings) * 1e6
+    p99 = timings[int(len(timings) * 0.99) - 1] * 1e6
+    print(f"{name:<22} median {median:8.1f} us   p99 {p99:8.1f} us")
+    return median
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sessions', type=int, default=200)
+    parser.add_argument('--budget-us', type=float, default=100.0)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        baseline = summarize("no persistence", run_reruns(args.sessions, lambda *a: None))
+
+        store = ProgressStore(os.path.join(tmp, 'write_behind.db'))
+        write_behind = summarize("write-behind store", run_reruns(args.sessions, store.save))
+        start = time.perf_counter()
+        store.flush()
+        print(f"{'':<22} background flush drained in {(time.perf_counter() - start) * 1e3:.1f} ms")
+        store.close()
+
+        conn = sqlite3.connect(os.path.join(tmp, 'sync.db'))
+        conn.execute(SCHEMA)
+
+        def save_sync(token, current_question, answers):
+            conn.execute("INSERT OR REPLACE INTO progress VALUES (?, ?, ?, ?, ?)",
+                         (token, current_question, repr(answers), time.time(), None))
+            conn.commit()
+
+        summarize("synchronous commit", run_reruns(args.sessions, save_sync))
+        conn.close()
+
+    overhead = write_behind - baseline
+    print(f"write-behind overhead per rerun: {overhead:.1f} us (budget {args.budget_us:.0f} us)")
+    return 0 if overhead <= args.budget_us else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
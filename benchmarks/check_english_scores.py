@@ -0,0 +1,113 @@
+"""Check that English answers score exactly as they did before locale packs.
+
+Runs find_best_therapy on real English answers, one at a time and as whole
+assessments, and compares its scores with the original single-language
+scorer below. Exits with status 1 and lists the differences if any answer
+is scored differently or taken for another language.
+
+    python benchmarks/check_english_scores.py
+
+Needs the app's requirements installed, since it imports app.py.
+"""
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app import DEFAULT_LOCALE, TherapyBotGuide, detect_locale  # noqa: E402
+
+ANSWERS = [
+    "Worry keeps me up at night",
+    "Grief, de-motivated, sad",
+    "Panic attacks, plus depression",
+    "Anger issues plus stress at work",
+    "I've been anxious and stressed since my breakup, lots of negative thoughts and arguing with my partner",
+    "About six months, maybe longer",
+    "7",
+    "10",
+    "Yes",
+    "No, never",
+    "I tried therapy once, it helped me understand my patterns",
+    "Online would be easier",
+    "I need something low-cost",
+    "In person, ideally near Montreal",
+    "I'm in Ontario and my insurance covers some of it",
+    "My husband and I fight constantly, we can't communicate",
+    "Flashbacks from a car accident last year",
+    "I was abused as a child and still have nightmares",
+    "Mood swings, I get overwhelmed and do things on impulse",
+    "Self-esteem, I don't know who I am anymore",
+    "Going through a divorce, family conflict with my kids",
+    "Overthinking everything, negative self talk",
+    "I feel empty and numb most days",
+    "Job loss, money worries, can't sleep",
+    "Nothing really, just curious",
+    "Le Chateau layoffs, en route to a new job, so stressed",
+    "Bipolar, ADHD, PTSD",
+    "C'mon, it's just stress",
+    "Cafe job, de facto manager, burnt out",
+    "Plus size and anxious about how people see me",
+    "Ne'er a good night of sleep since the trauma",
+    "J and I broke up, me and my ex still argue",
+    "Moving to a new city, big life transition",
+    "Being a new parent, my partner and I argue",
+    "Feeling hopeless, lonely, isolated",
+    "Grieving my mom, she passed in March",
+]
+
+ASSESSMENTS = [
+    ANSWERS[4:10],
+    ["Worry keeps me up at night", "A few years", "6", "No", "Online", "Affordable"],
+    ["Anger issues plus stress at work", "Since my teens", "8", "Yes, DBT skills group",
+     "Either", "My insurance covers some of it"],
+    ["Panic attacks, plus depression", "Months", "9", "Not yet", "In person", "Low-cost in Canada"],
+]
+
+
+def baseline_scores(therapy_types, user_problems):
+    """The scorer as it was before keyword packs: one English pass over the joined answers"""
+    therapy_scores = {therapy_name: 0 for therapy_name in therapy_types}
+    user_text = ' '.join(user_problems).lower()
+    user_words = set(user_text.split())
+    for therapy_name, therapy_info in therapy_types.items():
+        for keyword in therapy_info['good_for']:
+            keyword_lower = keyword.lower()
+            if keyword_lower in user_text:
+                therapy_scores[therapy_name] += 2
+            else:
+                for word in keyword_lower.split():
+                    if len(word) > 2 and word in user_words:
+                        therapy_scores[therapy_name] += 1
+                        break
+    if max(therapy_scores.values()) > 0:
+        best_therapy = max(therapy_scores, key=therapy_scores.get)
+    else:
+        best_therapy = 'CBT'
+    return best_therapy, therapy_scores
+
+
+def main():
+    bot = TherapyBotGuide()
+    failures = []
+    for answer in ANSWERS:
+        locale = detect_locale(answer)
+        if locale != DEFAULT_LOCALE:
+            failures.append(f"{answer!r}: detected as {locale}")
+    for user_problems in [[answer] for answer in ANSWERS] + ASSESSMENTS:
+        expected = baseline_scores(bot.therapy_types, user_problems)
+        actual = bot.find_best_therapy(user_problems)
+        if actual != expected:
+            failures.append(f"{user_problems!r}: {actual} != baseline {expected}")
+
+    checked = len(ANSWERS) + len(ASSESSMENTS)
+    if failures:
+        print(f"{len(failures)} of {checked} checks differ from the baseline scorer:")
+        for failure in failures:
+            print(f"  {failure}")
+        return 1
+    print(f"All {checked} English answers and assessments score as before")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,132 @@
+"""Compile therapy keyword lists into a deduplicated inverted index.
+
+Several keywords are listed under more than one therapy ("breakup" is in
+CBT and Family_Therapy), so matching each therapy's list separately checks
+them twice. ``build_keyword_index`` turns ``{therapy: [keyword, ...]}``
+into one entry per unique keyword carrying every (therapy, weight) it
+scores for; the matcher then checks each keyword once per request.
+Picking a language pack for an answer only looks at common words and
+accents, so the index scan is the only keyword matching a request does.
+
+``keyword_report`` describes the overlaps for whoever curates the lists:
+
+    python keyword_index.py [--locale fr] [--json]
+"""
+import argparse
+import json
+import sys
+from collections import Counter
+
+
+def build_keyword_index(good_for, normalize=str.lower):
+    """Return [(keyword, words, ((therapy, weight), ...), label), ...], one entry per unique keyword
+
+    ``keyword`` is the normalized text that is matched and ``label`` the
+    keyword as first written in the lists, for showing to users. ``words``
+    are the keyword's words longer than two letters, used for partial
+    matches. ``weight`` is how many times the therapy lists the keyword, so
+    scores are the same as matching every list entry separately.
+    """
+    therapies_by_keyword = {}
+    labels = {}
+    for therapy_name, keywords in good_for.items():
+        for keyword in keywords:
+            normalized = normalize(keyword)
+            labels.setdefault(normalized, keyword)
+            weights = therapies_by_keyword.setdefault(normalized, {})
+            weights[therapy_name] = weights.get(therapy_name, 0) + 1
+
+    index = []
+    for keyword, weights in therapies_by_keyword.items():
+        words = tuple(word for word in keyword.split() if len(word) > 2)
+        index.append((keyword, words, tuple(weights.items()), labels[keyword]))
+    return index
+
+
+def keyword_report(good_for, crisis_words=(), normalize=str.lower):
+    """Describe shared, shadowed and crisis-overlapping keywords and the match work saved
+
+    The scan counts are per request that uses this pack: one substring scan
+    per list entry before the index, one per unique keyword after it.
+    """
+    index = build_keyword_index(good_for, normalize)
+    keywords = [entry[0] for entry in index]
+    therapies = {keyword: [name for name, _ in weights] for keyword, _, weights, _ in index}
+
+    shared = {keyword: names for keyword, names in therapies.items() if len(names) > 1}
+    repeated = {}
+    for therapy_name, therapy_keywords in good_for.items():
+        counts = Counter(normalize(keyword) for keyword in therapy_keywords)
+        for keyword, count in counts.items():
+            if count > 1:
+                repeated.setdefault(keyword, []).append(therapy_name)
+    # "relationship" always matches when "relationship issues" does
+    shadowed = sorted(
+        (short, long) for short in keywords for long in keywords
+        if short != long and short in long
+    )
+    crisis = [normalize(phrase) for phrase in crisis_words]
+    crisis_overlaps = sorted(
+        (keyword, phrase) for keyword in keywords for phrase in crisis if keyword in phrase
+    )
+
+    entries = sum(len(keywords) for keywords in good_for.values())
+    return {
+        'therapies': len(good_for),
+        'keyword_entries': entries,
+        'unique_keywords': len(index),
+        'shared_across_therapies': shared,
+        'repeated_within_therapy': repeated,
+        'shadowed': [{'keyword': short, 'shadowed_by': long} for short, long in shadowed],
+        'crisis_overlaps': [{'keyword': keyword, 'crisis_phrase': phrase}
+                            for keyword, phrase in crisis_overlaps],
+        'substring_scans_before': entries,
+        'substring_scans_after': len(index),
+        'match_work_saved': round(1 - len(index) / entries, 4) if entries else 0.0,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Report keyword overlaps in a Therapy Guide keyword pack")
+    parser.add_argument('--locale', default='en', help="keyword pack to analyze (default: en)")
+    parser.add_argument('--json', action='store_true', help="print the report as JSON")
+    args = parser.parse_args(argv)
+
+    # Imported here so the index builder stays usable without Streamlit
+    from app import DEFAULT_LOCALE, LOCALE_CRISIS_WORDS, TherapyBotGuide, fold_text, load_locale_pack
+
+    if args.locale == DEFAULT_LOCALE:
+        bot = TherapyBotGuide()
+        good_for = {name: info['good_for'] for name, info in bot.therapy_types.items()}
+        crisis_words = bot.crisis_words
+    else:
+        good_for = load_locale_pack(args.locale)
+        crisis_words = LOCALE_CRISIS_WORDS.get(args.locale, [])
+    report = keyword_report(good_for, crisis_words, normalize=fold_text)
+
+    if args.json:
+        print(json.dumps(report, indent=2, ensure_ascii=False))
+        return 0
+
+    print(f"{args.locale}: {report['keyword_entries']} keyword entries across {report['therapies']} therapies, "
+          f"{report['unique_keywords']} unique")
+    print(f"Substring scans per request: {report['substring_scans_before']} -> "
+          f"{report['substring_scans_after']} ({report['match_work_saved']:.1%} less work)")
+    print("Shared across therapies:")
+    for keyword, names in report['shared_across_therapies'].items():
+        print(f"  {keyword}: {', '.join(names)}")
+    if report['repeated_within_therapy']:
+        print("Listed twice in the same therapy:")
+        for keyword, names in report['repeated_within_therapy'].items():
+            print(f"  {keyword}: {', '.join(names)}")
+    print("Shadowed (always matched when the longer keyword is):")
+    for entry in report['shadowed']:
+        print(f"  {entry['keyword']!r} in {entry['shadowed_by']!r}")
+    print("Overlapping crisis phrases:")
+    for entry in report['crisis_overlaps']:
+        print(f"  {entry['keyword']!r} in crisis phrase {entry['crisis_phrase']!r}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
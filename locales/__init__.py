@@ -0,0 +1,11 @@
+"""Locale keyword packs for the Therapy Guide matcher.
+
+Each module in this package is named after a locale code (e.g. ``fr``) and
+defines ``GOOD_FOR``: a dict mapping each ``TherapyBotGuide.therapy_types``
+key to its keyword list in that language. Crisis phrases are not part of a
+pack; they are always checked, so every language's phrases live in
+``LOCALE_CRISIS_WORDS`` in ``app.py``.
+
+Packs are imported on first use by ``load_locale_pack`` in ``app.py``, so
+a locale costs nothing until an answer written in it is seen.
+"""
@@ -0,0 +1,61 @@
+"""French (fr) keyword pack"""
+
+GOOD_FOR = {
+    'CBT': [
+        'anxiété', 'anxieux', 'anxieuse', 'angoisse', 'angoissée',
+        'dépression', 'déprimé', 'déprimée', 'triste', 'tristesse',
+        'inquiet', 'inquiète', 'inquiétude', 'inquiétudes', "m'inquiète",
+        'panique', 'paniquée', 'crise de panique',
+        'pensées négatives', 'pensée négative',
+        'peur', 'peurs', 'effrayé', 'effrayée',
+        'stress', 'stressé', 'stressée', 'stressant', 'stressante',
+        'rumine', 'ruminer', 'ruminations', 'trop réfléchir',
+        'habitudes', 'schémas',
+        'rupture', 'ruptures', 'chagrin d\'amour', 'coeur brisé'
+    ],
+    'DBT': [
+        'émotions intenses', 'émotions fortes', 'intensité émotionnelle',
+        'automutilation', 'me scarifier', 'scarification',
+        'relations', 'relation', 'problèmes relationnels',
+        'personnalité limite', 'borderline', 'instable',
+        'colère', 'en colère', 'enragé', 'enragée', 'furieux', 'furieuse',
+        'émotif', 'émotive', 'émotionnel', 'émotionnelle',
+        'régulation émotionnelle',
+        'débordé', 'débordée', 'submergé', 'submergée', 'dépassé', 'dépassée',
+        'impulsif', 'impulsive', 'impulsivité'
+    ],
+    'Family_Therapy': [
+        'problèmes familiaux', 'conflit familial', 'conflits familiaux',
+        'problèmes de couple', 'conflit de couple', 'problèmes relationnels',
+        'communication', 'communiquer', 'problèmes de communication',
+        'couple', 'conjoint', 'conjointe', 'partenaire', 'mariage',
+        'mon mari', 'ma femme', 'épouse', 'famille',
+        'conflit', 'conflits',
+        'dispute', 'disputes', 'se disputer', 'chicane', 'chicanes',
+        'divorce', 'divorcée', 'séparation', 'rupture',
+        'amour', 'confiance', 'intimité'
+    ],
+    'Trauma_Therapy': [
+        'traumatisme', 'trauma', 'traumatisant', 'traumatisé', 'traumatisée',
+        'tspt', 'stress post-traumatique', 'post-traumatique', 'post traumatique',
+        'mauvais souvenirs', 'souvenirs traumatiques', 'souvenirs douloureux',
+        'abus', 'abusé', 'abusée', 'maltraitance', 'maltraité', 'maltraitée',
+        'flashbacks', 'flashback', 'reviviscences', 'pensées intrusives',
+        'violence', 'violent', 'violente', 'agression', 'agressé', 'agressée',
+        'accident', 'accidents',
+        'douloureux', 'douloureuse', 'douleur', 'blessé', 'blessée', 'blessure',
+        'hanté', 'hantée', 'perturbant', 'perturbante'
+    ],
+    'Humanistic': [
+        'estime de soi', 'faible estime de soi', 'confiance en soi',
+        'identité', "problèmes d'identité",
+        'croissance personnelle', 'développement personnel', 'grandir',
+        'transitions', 'transition', 'changement', 'changer',
+        'donner un sens', 'raison d\'être',
+        'authentique', 'authenticité',
+        'acceptation de soi', "m'accepter",
+        'valeurs',
+        'épanouissement', "m'épanouir",
+        'compassion envers soi', 'bienveillance envers soi', 'compassion'
+    ]
+}
@@ -0,0 +1,191 @@
+"""Local SQLite store for in-flight assessment progress.
+
+Progress is keyed by an opaque session token so an assessment can resume
+after a server restart or a dropped websocket. ``save`` only puts the write
+on an in-memory queue; a background thread batches queued writes into a
+single transaction, so the Streamlit rerun never waits on disk I/O.
+"""
+import json
+import os
+import queue
+import secrets
+import sqlite3
+import threading
+import time
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS progress (
+    token TEXT PRIMARY KEY,
+    current_question INTEGER NOT NULL,
+    answers TEXT NOT NULL,
+    updated_at REAL NOT NULL,
+    assessment_id TEXT
+)
+"""
+
+_DELETE = object()
+
+
+def new_session_token():
+    """Return a random, URL-safe token that reveals nothing about the user"""
+    return secrets.token_urlsafe(16)
+
+
+class ProgressStore:
+    """Write-behind progress store backed by a local SQLite file"""
+
+    def __init__(self, path, batch_size=64, flush_interval=0.25, pool_size=4,
+                 max_age=24 * 60 * 60):
+        self.path = path
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_age = max_age
+
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+
+        # Writes not yet committed, so a load right after a save sees them
+        self._pending = {}
+        self._pending_lock = threading.Lock()
+        self._drained = threading.Condition(self._pending_lock)
+        self._outstanding = 0
+        self._queue = queue.Queue()
+        self._closed = False
+
+        self._writer = self._connect()
+        self._writer.execute("PRAGMA journal_mode=WAL")
+        self._writer.execute(SCHEMA)
+        columns = [row[1] for row in self._writer.execute("PRAGMA table_info(progress)")]
+        if 'assessment_id' not in columns:
+            self._writer.execute("ALTER TABLE progress ADD COLUMN assessment_id TEXT")
+        self._writer.execute(
+            "DELETE FROM progress WHERE updated_at < ?", (time.time() - max_age,)
+        )
+        self._writer.commit()
+
+        self._readers = queue.LifoQueue()
+        for _ in range(pool_size):
+            self._readers.put(self._connect())
+
+        self._thread = threading.Thread(
+            target=self._write_loop, name="progress-store-writer", daemon=True
+        )
+        self._thread.start()
+
+    def _connect(self):
+        return sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+
+    def save(self, token, current_question, answers, assessment_id=None):
+        """Queue the latest progress for a token; returns immediately"""
+        if self._closed or not token:
+            return
+        record = (int(current_question), list(answers), time.time(), assessment_id)
+        with self._pending_lock:
+            self._pending[token] = record
+            self._outstanding += 1
+        self._queue.put(token)
+
+    def delete(self, token):
+        """Queue removal of a token's progress, e.g. after Start Over"""
+        if self._closed or not token:
+            return
+        with self._pending_lock:
+            self._pending[token] = _DELETE
+            self._outstanding += 1
+        self._queue.put(token)
+
+    def load(self, token):
+        """Return (current_question, answers, assessment_id) for a token, or None if unknown"""
+        if not token:
+            return None
+        with self._pending_lock:
+            record = self._pending.get(token)
+        if record is _DELETE:
+            return None
+        if record is not None:
+            return record[0], list(record[1]), record[3]
+
+        conn = self._readers.get()
+        try:
+            row = conn.execute(
+                "SELECT current_question, answers, updated_at, assessment_id FROM progress WHERE token = ?",
+                (token,)
+            ).fetchone()
+        finally:
+            self._readers.put(conn)
+        if row is None or row[2] < time.time() - self.max_age:
+            return None
+        return row[0], json.loads(row[1]), row[3]
+
+    def flush(self, timeout=None):
+        """Block until every queued write is committed; returns False on timeout"""
+        with self._drained:
+            return self._drained.wait_for(lambda: self._outstanding == 0, timeout)
+
+    def close(self):
+        """Commit outstanding writes, stop the writer and close connections"""
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put(None)
+        self._thread.join()
+        while not self._readers.empty():
+            self._readers.get_nowait().close()
+
+    def _write_loop(self):
+        running = True
+        while running:
+            try:
+                token = self._queue.get(timeout=self.flush_interval)
+            except queue.Empty:
+                continue
+            tokens, taken = set(), 0
+            while True:
+                if token is None:
+                    running = False
+                else:
+                    tokens.add(token)
+                    taken += 1
+                if taken >= self.batch_size:
+                    break
+                try:
+                    token = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+            if tokens:
+                self._commit(tokens)
+            with self._drained:
+                self._outstanding -= taken
+                if self._outstanding == 0:
+                    self._drained.notify_all()
+        self._writer.close()
+
+    def _commit(self, tokens):
+        with self._pending_lock:
+            batch = {token: self._pending[token] for token in tokens if token in self._pending}
+        upserts = [
+            (token, record[0], json.dumps(record[1]), record[2], record[3])
+            for token, record in batch.items() if record is not _DELETE
+        ]
+        deletes = [(token,) for token, record in batch.items() if record is _DELETE]
+
+        self._writer.execute("BEGIN")
+        try:
+            if upserts:
+                self._writer.executemany(
+                    "INSERT OR REPLACE INTO progress "
+                    "(token, current_question, answers, updated_at, assessment_id) VALUES (?, ?, ?, ?, ?)",
+                    upserts
+                )
+            if deletes:
+                self._writer.executemany("DELETE FROM progress WHERE token = ?", deletes)
+            self._writer.execute("COMMIT")
+        except sqlite3.Error:
+            self._writer.execute("ROLLBACK")
+            return
+
+        # Only drop entries that were not overwritten while we were committing
+        with self._pending_lock:
+            for token, record in batch.items():
+                if self._pending.get(token) is record:
+                    del self._pending[token]
@@ -0,0 +1,115 @@
+"""Start the Therapy Guide with a warm cache and a readiness endpoint.
+
+    python serve.py [--port 8501] [--ready-port 8502]
+
+Before the Streamlit server starts, app.py is run in-process with
+``warm_up_only`` set, which calls its ``warm_up()`` directly: the knowledge
+base, the crisis pattern for every locale, the keyword matchers for
+THERAPY_GUIDE_WARM_LOCALES (default: en) and the shared services go into
+the ``st.cache_resource`` caches. The home
+page and an in-progress assessment are then rendered once so every
+first-paint import is loaded before the first real visitor arrives.
+``GET /ready`` on the ready port returns 200 only once warm-up has finished
+and Streamlit's own health check answers; until then it returns 503.
+``GET /live`` always returns 200 while the process is up.
+"""
+import argparse
+import json
+import logging
+import os
+import threading
+import time
+import urllib.request
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+APP_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'app.py')
+
+logger = logging.getLogger('therapy_guide.serve')
+
+state = {
+    'warm': False,
+    'warm_up_seconds': None,
+    'streamlit_port': 8501,
+}
+
+
+def warm_up(timeout=60):
+    """Fill the app's caches, then render each entry page once"""
+    from streamlit.testing.v1 import AppTest
+
+    start = time.perf_counter()
+    # AppTest runs app.py as __main__, like a real session, so cache keys match
+    runs = ({'warm_up_only': True}, {'assessment_started': False}, {'assessment_started': True})
+    for session_state in runs:
+        app_test = AppTest.from_file(APP_PATH, default_timeout=timeout)
+        for key, value in session_state.items():
+            app_test.session_state[key] = value
+        app_test.run()
+        if app_test.exception:
+            raise RuntimeError(f"Warm-up run failed: {app_test.exception}")
+    state['warm_up_seconds'] = round(time.perf_counter() - start, 3)
+    state['warm'] = True
+    logger.info("Warm-up finished in %.2fs", state['warm_up_seconds'])
+
+
+def streamlit_healthy():
+    """Ask Streamlit's own health endpoint whether the server is serving"""
+    url = f"http://127.0.0.1:{state['streamlit_port']}/_stcore/health"
+    try:
+        with urllib.request.urlopen(url, timeout=1) as response:
+            return response.status == 200
+    except OSError:
+        return False
+
+
+def is_ready():
+    return state['warm'] and streamlit_healthy()
+
+
+class ReadinessHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path not in ('/live', '/ready'):
+            self.send_error(404)
+            return
+        ready = is_ready()
+        status = 200 if ready or self.path == '/live' else 503
+        body = json.dumps({
+            'ready': ready,
+            'warm': state['warm'],
+            'warm_up_seconds': state['warm_up_seconds'],
+        }).encode()
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        logger.debug(format, *args)
+
+
+def start_readiness_server(port):
+    server = ThreadingHTTPServer(('0.0.0.0', port), ReadinessHandler)
+    threading.Thread(target=server.serve_forever, name='readiness', daemon=True).start()
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve the Therapy Guide with boot-time warm-up")
+    parser.add_argument('--port', type=int, default=8501, help="Streamlit port")
+    parser.add_argument('--ready-port', type=int, default=8502, help="readiness endpoint port")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s %(name)s %(message)s')
+
+    state['streamlit_port'] = args.port
+    start_readiness_server(args.ready_port)
+    warm_up()
+
+    from streamlit.web import bootstrap
+    flag_options = {'server_port': args.port, 'server_headless': True}
+    bootstrap.load_config_options(flag_options=flag_options)
+    bootstrap.run(APP_PATH, None, [], flag_options)
+
+
+if __name__ == '__main__':
+    main()